@@ -2,6 +2,8 @@ from flask import Flask, render_template, request, jsonify, redirect, url_for, f
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user
 import pandas as pd
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from werkzeug.utils import secure_filename
 from datetime import datetime
 
@@ -13,8 +15,12 @@ app = Flask(__name__)
 app.config['SECRET_KEY'] = 'your-secret-key-here'
 app.config['UPLOAD_FOLDER'] = 'uploads'
 app.config['MAX_CONTENT_LENGTH'] = 16 * 1024 * 1024  # 16MB max file size
+app.config['CHART_BATCH_WORKERS'] = 4  # datasets scanned in parallel by /get-charts
+app.config['CHART_BATCH_MAX'] = 50  # max chart ids accepted by /get-charts
+app.config['CHART_SERIES_MAX_POINTS'] = 1000  # max points in a saved chart's series
+app.config['CHART_SERIES_CACHE_SIZE'] = 256  # series kept in memory between requests
 
-app.config["SQLALCHEMY_DATABASE_URI"] = 'sqlite:///fluxion.db'
+app.config["SQLALCHEMY_DATABASE_URI"] = os.environ.get('DATABASE_URL', 'sqlite:///fluxion.db')
 app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
 
 db.init_app(app)
@@ -34,9 +40,127 @@ os.makedirs(app.config['UPLOAD_FOLDER'], exist_ok=True)
 # Allowed file extensions
 ALLOWED_EXTENSIONS = {'csv', 'xlsx', 'xls'}
 
+# Shared worker pool for dataset scans, and computed series keyed by
+# (file path, modification time, series key) so unchanged files aren't re-read
+series_executor = ThreadPoolExecutor(max_workers=app.config['CHART_BATCH_WORKERS'])
+series_cache = {}
+series_cache_lock = threading.Lock()
+
 def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in ALLOWED_EXTENSIONS
 
+def chart_series_spec(chart):
+    """Return (key, kind, label_column, value_column) describing a chart's series.
+
+    Charts that plot the same columns of the same dataset share a key, so
+    their series is only computed and sent once.
+    """
+    config = chart.get_config()
+    if chart.chart_type == 'pie':
+        kind, label_col, value_col = 'pie', config.get('label_column'), config.get('value_column')
+    else:
+        kind, label_col, value_col = 'axis', config.get('x_axis'), config.get('y_axis')
+    return f'{chart.dataset_id}:{kind}:{label_col}:{value_col}', kind, label_col, value_col
+
+def compute_dataset_series(filepath, series_specs, max_points):
+    """Read a dataset once and build every series requested from it.
+
+    series_specs is a list of (key, kind, label_column, value_column) tuples.
+    Only the columns referenced by those specs are loaded from disk. Each
+    series holds one point per row, like the chart editor, capped at
+    max_points. If the file cannot be read, every series is None so the
+    client can fall back to the dataset preview.
+    """
+    # Chart configs store column names as strings, but Excel headers can be numbers
+    needed = {str(col) for _, _, label_col, value_col in series_specs for col in (label_col, value_col)}
+    usecols = lambda col: str(col) in needed
+
+    try:
+        if filepath.endswith('.csv'):
+            df = pd.read_csv(filepath, usecols=usecols)
+        else:  # Excel files
+            df = pd.read_excel(filepath, usecols=usecols)
+    except Exception:
+        app.logger.exception('Could not read dataset %s', filepath)
+        return {key: None for key, _, _, _ in series_specs}
+    df.columns = df.columns.map(str)
+
+    series = {}
+    for key, kind, label_col, value_col in series_specs:
+        label_col, value_col = str(label_col), str(value_col)
+        if label_col not in df.columns or value_col not in df.columns:
+            series[key] = {'labels': [], 'values': [], 'total': 0, 'truncated': False}
+            continue
+
+        # Skip the same rows as the client: blank labels, and for pie
+        # charts falsy labels (0, False) too
+        labels = df[label_col]
+        mask = labels.notna() & (labels.astype(str) != '')
+        if kind == 'pie':
+            mask &= ~labels.map(lambda v: pd.api.types.is_number(v) and v == 0)
+
+        # Non-numeric values count as 0
+        values = pd.to_numeric(df.loc[mask, value_col], errors='coerce').fillna(0)
+        total = len(values)
+
+        series[key] = {
+            'labels': labels[mask].iloc[:max_points].tolist(),
+            'values': values.iloc[:max_points].tolist(),
+            'total': total,
+            'truncated': total > max_points
+        }
+    return series
+
+def load_chart_series(charts):
+    """Compute the series for a list of charts, scanning each dataset once.
+
+    Series already cached for the current version of a file are reused;
+    the remaining datasets are scanned in parallel. Returns a dict keyed by
+    chart_series_spec key; charts whose dataset is missing or unreadable
+    have no entry.
+    """
+    groups = {}
+    for chart in charts:
+        key, kind, label_col, value_col = chart_series_spec(chart)
+        groups.setdefault(chart.dataset_id, {})[key] = (key, kind, label_col, value_col)
+
+    if not groups:
+        return {}
+
+    series = {}
+    jobs = []
+    for dataset in Dataset.query.filter(Dataset.id.in_(groups)).all():
+        filepath = os.path.join(app.config['UPLOAD_FOLDER'], dataset.filename)
+        if not os.path.exists(filepath):
+            continue
+
+        mtime = os.path.getmtime(filepath)
+        missing = []
+        with series_cache_lock:
+            for spec in groups[dataset.id].values():
+                cached = series_cache.get((filepath, mtime, spec[0]))
+                if cached is not None:
+                    series[spec[0]] = cached
+                else:
+                    missing.append(spec)
+        if missing:
+            jobs.append((filepath, mtime, missing))
+
+    # A single dataset is scanned inline; several go to the worker pool
+    scan = lambda job: compute_dataset_series(job[0], job[2], app.config['CHART_SERIES_MAX_POINTS'])
+    results = [scan(jobs[0])] if len(jobs) == 1 else series_executor.map(scan, jobs)
+
+    for (filepath, mtime, _), result in zip(jobs, results):
+        for key, value in result.items():
+            if value is None:
+                continue
+            series[key] = value
+            with series_cache_lock:
+                series_cache[(filepath, mtime, key)] = value
+                if len(series_cache) > app.config['CHART_SERIES_CACHE_SIZE']:
+                    series_cache.pop(next(iter(series_cache)))
+    return series
+
 # Routes
 @app.route('/')
 def landing():
@@ -299,6 +423,7 @@ def get_chart(chart_id):
         
         # Get chart with dataset info
         chart_data = chart.to_dict()
+        chart_data['series'] = load_chart_series([chart]).get(chart_series_spec(chart)[0])
         
         return jsonify({
             'success': True,
@@ -308,6 +433,53 @@ def get_chart(chart_id):
     except Exception as e:
         return jsonify({'error': f'Error loading chart: {str(e)}'}), 500
 
+@app.route('/get-charts', methods=['POST'])
+@login_required
+def get_charts():
+    """Get data for several charts at once, reading each dataset only once"""
+    try:
+        data = request.get_json(silent=True)
+        if not isinstance(data, dict):
+            return jsonify({'error': 'Request body must be a JSON object'}), 400
+
+        chart_ids = data.get('chart_ids', [])
+        if not isinstance(chart_ids, list) or not chart_ids:
+            return jsonify({'error': 'No chart ids provided'}), 400
+
+        if len(chart_ids) > app.config['CHART_BATCH_MAX']:
+            return jsonify({'error': f"Too many charts requested (max {app.config['CHART_BATCH_MAX']})"}), 400
+
+        # Accept real integers or digit strings; reject bools, floats and the rest
+        if not all((isinstance(chart_id, int) and not isinstance(chart_id, bool))
+                   or (isinstance(chart_id, str) and chart_id.isascii() and chart_id.isdigit())
+                   for chart_id in chart_ids):
+            return jsonify({'error': 'Chart ids must be integers'}), 400
+        chart_ids = [int(chart_id) for chart_id in chart_ids]
+
+        charts = Chart.query.filter(
+            Chart.id.in_(chart_ids),
+            Chart.user_id == current_user.id
+        ).all()
+
+        series = load_chart_series(charts)
+
+        # Charts plotting the same columns share one entry in the series table
+        charts_data = {}
+        for chart in charts:
+            key = chart_series_spec(chart)[0]
+            chart_data = chart.to_dict(include_dataset=False)
+            chart_data['series_key'] = key if key in series else None
+            charts_data[chart.id] = chart_data
+
+        return jsonify({
+            'success': True,
+            'charts': charts_data,
+            'series': series
+        })
+
+    except Exception as e:
+        return jsonify({'error': f'Error loading charts: {str(e)}'}), 500
+
 @app.route('/download-dataset/<int:dataset_id>')
 @login_required
 def download_dataset(dataset_id):
@@ -421,8 +593,11 @@ def view_shared_chart(share_token):
     try:
         chart = Chart.query.filter_by(share_token=share_token, is_public=True).first_or_404()
         
+        chart_data = chart.to_dict()
+        chart_data['series'] = load_chart_series([chart]).get(chart_series_spec(chart)[0])
+        
         # Render shared chart page
-        return render_template('shared_chart.html', chart=chart.to_dict())
+        return render_template('shared_chart.html', chart=chart_data)
         
     except Exception as e:
         return render_template('error.html', 
@@ -130,7 +130,7 @@ class Chart(db.Model):
         """Retrieve chart configuration from JSON"""
         return json.loads(self.config)
     
-    def to_dict(self):
+    def to_dict(self, include_dataset=True):
         """Convert chart to dictionary"""
         return {
             'id': self.id,
@@ -141,7 +141,7 @@ class Chart(db.Model):
             'updated_at': self.updated_at.isoformat(),
             'is_public': self.is_public,
             'share_token': self.share_token,
-            'dataset': self.dataset.to_dict() if self.dataset else None
+            'dataset': self.dataset.to_dict() if self.dataset and include_dataset else None
         }
     
     def __repr__(self):
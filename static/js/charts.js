@@ -2,6 +2,14 @@
 
 let currentModalChart = null;
 let currentChartData = null;
+let chartCache = {};
+let chartRequests = {};
+let requestedChartIds = new Set();
+let pendingChartIds = [];
+let pendingBatchTimer = null;
+
+// Max chart ids per /get-charts request (matches CHART_BATCH_MAX in app.py)
+const CHART_BATCH_SIZE = 50;
 
 // Color schemes (same as create_chart.js)
 const colorSchemes = {
@@ -11,9 +19,76 @@ const colorSchemes = {
     rainbow: ['#EF4444', '#F97316', '#EAB308', '#22C55E', '#3B82F6', '#8B5CF6']
 };
 
+// Queue a chart to be fetched with the next batch request
+function queueChartPrefetch(chartId) {
+    if (requestedChartIds.has(chartId)) {
+        return;
+    }
+    requestedChartIds.add(chartId);
+    pendingChartIds.push(chartId);
+    
+    // Collect charts hovered in quick succession into one request
+    if (!pendingBatchTimer) {
+        pendingBatchTimer = setTimeout(flushChartPrefetch, 150);
+    }
+}
+
+// Fetch the queued charts in batches
+function flushChartPrefetch() {
+    clearTimeout(pendingBatchTimer);
+    pendingBatchTimer = null;
+    
+    while (pendingChartIds.length > 0) {
+        const chartIds = pendingChartIds.splice(0, CHART_BATCH_SIZE);
+        const request = loadChartsBatch(chartIds);
+        chartIds.forEach(chartId => {
+            chartRequests[chartId] = request;
+        });
+    }
+}
+
+// Load several charts with a single batch request
+function loadChartsBatch(chartIds) {
+    return fetch('/get-charts', {
+        method: 'POST',
+        headers: {
+            'Content-Type': 'application/json'
+        },
+        body: JSON.stringify({ chart_ids: chartIds })
+    })
+    .then(response => response.json())
+    .then(data => {
+        if (data.success) {
+            // Attach each chart's series from the shared series table
+            Object.values(data.charts).forEach(chart => {
+                if (chart.series_key) {
+                    chart.series = data.series[chart.series_key];
+                    chartCache[chart.id] = chart;
+                }
+            });
+        }
+    })
+    .catch(error => {
+        console.error('Error fetching charts:', error);
+    });
+}
+
 // View Chart in Modal
 async function viewChartModal(chartId) {
     try {
+        // Use the prefetched data, waiting for it if its request is in flight
+        if (pendingChartIds.includes(chartId)) {
+            flushChartPrefetch();
+        }
+        if (chartRequests[chartId]) {
+            await chartRequests[chartId];
+        }
+        if (chartCache[chartId]) {
+            currentChartData = chartCache[chartId];
+            openChartModal(chartCache[chartId]);
+            return;
+        }
+        
         // Fetch chart data from server
         const response = await fetch(`/get-chart/${chartId}`);
         const data = await response.json();
@@ -93,9 +168,20 @@ function renderModalChart(chartData) {
     const config = chartData.config;
     const dataset = chartData.dataset;
     
+    // Tell the user when the server capped the number of points
+    const notice = document.getElementById('modalChartNotice');
+    if (chartData.series && chartData.series.truncated) {
+        notice.textContent = `Showing the first ${chartData.series.labels.length} of ${chartData.series.total} rows.`;
+        notice.classList.add('show');
+    } else {
+        notice.classList.remove('show');
+    }
+    
     // Prepare chart data based on type
     let preparedData;
-    if (chartData.chart_type === 'pie') {
+    if (chartData.series) {
+        preparedData = prepareSeriesData(chartData.series, config.y_axis, chartData.chart_type, config.color_scheme);
+    } else if (chartData.chart_type === 'pie') {
         preparedData = preparePieData(dataset.preview, config.value_column, config.label_column, config.color_scheme);
     } else {
         preparedData = prepareAxisData(dataset.preview, config.x_axis, config.y_axis, chartData.chart_type, config.color_scheme);
@@ -192,6 +278,31 @@ function prepareAxisData(data, xColumn, yColumn, chartType, colorScheme) {
     };
 }
 
+// Prepare Chart Data from a server-computed series
+function prepareSeriesData(series, yColumn, chartType, colorScheme) {
+    if (chartType === 'pie') {
+        return {
+            labels: series.labels,
+            datasets: [{
+                data: series.values,
+                backgroundColor: getColors(series.values.length, colorScheme)
+            }]
+        };
+    }
+    
+    return {
+        labels: series.labels,
+        datasets: [{
+            label: yColumn,
+            data: series.values,
+            backgroundColor: getColors(series.values.length, colorScheme),
+            borderColor: (colorSchemes[colorScheme] || colorSchemes.default)[0],
+            borderWidth: chartType === 'line' ? 2 : 1,
+            tension: chartType === 'line' ? 0.4 : 0
+        }]
+    };
+}
+
 // Get Colors from Scheme
 function getColors(count, scheme = 'default') {
     const colors = colorSchemes[scheme] || colorSchemes.default;
@@ -446,6 +557,13 @@ function copyToClipboard(text) {
 document.addEventListener('DOMContentLoaded', function() {
     console.log('My Charts page loaded');
     
+    // Prefetch a chart's data when the user points at or focuses its card
+    document.querySelectorAll('.chart-card[data-chart-id]').forEach(card => {
+        const chartId = parseInt(card.dataset.chartId, 10);
+        card.addEventListener('mouseenter', () => queueChartPrefetch(chartId));
+        card.addEventListener('focusin', () => queueChartPrefetch(chartId));
+    });
+    
     // Close modal on Escape key
     document.addEventListener('keydown', function(e) {
         if (e.key === 'Escape') {
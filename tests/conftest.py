@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pytest
+
+# Use an in-memory database instead of instance/fluxion.db
+os.environ['DATABASE_URL'] = 'sqlite://'
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as fluxion
+from models import db, User, Dataset, Chart
+
+
+@pytest.fixture
+def app(tmp_path):
+    """App configured with a fresh database and a temporary upload folder"""
+    fluxion.app.config.update(TESTING=True, UPLOAD_FOLDER=str(tmp_path))
+    fluxion.series_cache.clear()
+    with fluxion.app.app_context():
+        db.create_all()
+        yield fluxion.app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def user(app):
+    user = User(username='alice', email='alice@example.com')
+    user.set_password('password')
+    db.session.add(user)
+    db.session.commit()
+    return user
+
+
+@pytest.fixture
+def client(app, user):
+    """Test client logged in as the user fixture"""
+    client = app.test_client()
+    with client.session_transaction() as session:
+        session['_user_id'] = str(user.id)
+    return client
+
+
+@pytest.fixture
+def make_dataset(app, user):
+    """Create a Dataset row, writing a DataFrame to the upload folder if given"""
+    def make(filename, df=None, owner=None):
+        if df is not None:
+            path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+            if filename.endswith('.csv'):
+                df.to_csv(path, index=False)
+            else:
+                df.to_excel(path, index=False)
+        columns = list(df.columns) if df is not None else []
+        dataset = Dataset(
+            filename=filename,
+            original_filename=filename,
+            file_size=0,
+            rows=len(df) if df is not None else 0,
+            columns=len(columns),
+            user_id=(owner or user).id
+        )
+        dataset.set_column_names(columns)
+        dataset.set_data_types({})
+        dataset.set_preview_data([])
+        db.session.add(dataset)
+        db.session.commit()
+        return dataset
+    return make
+
+
+@pytest.fixture
+def make_chart(app, user):
+    """Create a Chart row plotting label/value columns of a dataset"""
+    def make(dataset, label, value, chart_type='bar', owner=None):
+        chart = Chart(
+            title=f'{label} by {value}',
+            chart_type=chart_type,
+            user_id=(owner or user).id,
+            dataset_id=dataset.id
+        )
+        if chart_type == 'pie':
+            chart.set_config({'label_column': label, 'value_column': value, 'color_scheme': 'default'})
+        else:
+            chart.set_config({'x_axis': label, 'y_axis': value, 'color_scheme': 'default'})
+        db.session.add(chart)
+        db.session.commit()
+        return chart
+    return make
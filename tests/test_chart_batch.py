@@ -0,0 +1,205 @@
+import os
+
+import pandas as pd
+import pytest
+
+import app as fluxion
+from models import db, User
+
+
+@pytest.fixture
+def sales(make_dataset):
+    return make_dataset('sales.csv', pd.DataFrame({
+        'region': ['north', 'south', 'north', '', '0'],
+        'code': [0, 1, 0, 2, 3],
+        'revenue': [10, 20, 30, 40, 'n/a'],
+        'notes': ['a', 'b', 'c', 'd', 'e'],
+    }))
+
+
+@pytest.fixture
+def read_spy(monkeypatch):
+    """Record the file and columns of every dataset read"""
+    reads = []
+    real_read_csv, real_read_excel = pd.read_csv, pd.read_excel
+
+    def spy(real):
+        def read(path, *args, **kwargs):
+            df = real(path, *args, **kwargs)
+            reads.append((os.path.basename(path), sorted(df.columns.map(str))))
+            return df
+        return read
+
+    monkeypatch.setattr(pd, 'read_csv', spy(real_read_csv))
+    monkeypatch.setattr(pd, 'read_excel', spy(real_read_excel))
+    return reads
+
+
+def get_charts(client, chart_ids):
+    response = client.post('/get-charts', json={'chart_ids': chart_ids})
+    return response.status_code, response.get_json()
+
+
+def series_for(body, chart):
+    key = body['charts'][str(chart.id)]['series_key']
+    return body['series'][key] if key else None
+
+
+def test_batch_reads_each_dataset_once_with_only_referenced_columns(client, sales, make_dataset, make_chart, read_spy):
+    other = make_dataset('other.xlsx', pd.DataFrame({2020: ['p', 'q'], 2021: [1, 2], 'unused': [0, 0]}))
+    charts = [
+        make_chart(sales, 'region', 'revenue'),
+        make_chart(sales, 'region', 'revenue', chart_type='line'),
+        make_chart(sales, 'code', 'revenue', chart_type='pie'),
+        make_chart(other, '2020', '2021'),
+    ]
+
+    status, body = get_charts(client, [chart.id for chart in charts])
+
+    assert status == 200
+    assert sorted(read_spy) == [('other.xlsx', ['2020', '2021']), ('sales.csv', ['code', 'region', 'revenue'])]
+    assert series_for(body, charts[3])['labels'] == ['p', 'q']
+    assert all(chart['dataset'] is None for chart in body['charts'].values())
+
+
+def test_charts_plotting_the_same_columns_share_one_series(client, sales, make_chart):
+    bar = make_chart(sales, 'region', 'revenue')
+    line = make_chart(sales, 'region', 'revenue', chart_type='line')
+
+    status, body = get_charts(client, [bar.id, line.id])
+
+    assert status == 200
+    assert body['charts'][str(bar.id)]['series_key'] == body['charts'][str(line.id)]['series_key']
+    assert len(body['series']) == 1
+
+
+def test_series_keeps_one_point_per_row(client, make_dataset, make_chart):
+    points = make_dataset('points.csv', pd.DataFrame({'x': [1, 1, 2], 'y': [5, 7, 3]}))
+    scatter = make_chart(points, 'x', 'y', chart_type='scatter')
+
+    _, body = get_charts(client, [scatter.id])
+
+    series = series_for(body, scatter)
+    assert series['labels'] == [1, 1, 2]
+    assert series['values'] == [5, 7, 3]
+
+
+def test_series_skips_rows_like_the_client(client, sales, make_chart):
+    bar = make_chart(sales, 'region', 'revenue')
+    pie = make_chart(sales, 'code', 'revenue', chart_type='pie')
+
+    _, body = get_charts(client, [bar.id, pie.id])
+
+    # Blank labels are skipped and non-numeric values count as 0
+    assert series_for(body, bar)['labels'] == ['north', 'south', 'north', '0']
+    assert series_for(body, bar)['values'] == [10, 20, 30, 0]
+    # Pie charts also skip falsy labels such as 0
+    assert series_for(body, pie)['labels'] == [1, 2, 3]
+
+
+def test_missing_column_gives_empty_series(client, sales, make_chart):
+    chart = make_chart(sales, 'missing', 'revenue')
+
+    _, body = get_charts(client, [chart.id])
+
+    assert series_for(body, chart) == {'labels': [], 'values': [], 'total': 0, 'truncated': False}
+
+
+def test_unreadable_and_missing_files_only_affect_their_charts(client, app, sales, make_dataset, make_chart):
+    broken = make_dataset('broken.xlsx')
+    with open(os.path.join(app.config['UPLOAD_FOLDER'], 'broken.xlsx'), 'w') as f:
+        f.write('not a spreadsheet')
+    gone = make_dataset('gone.csv')
+    good = make_chart(sales, 'region', 'revenue')
+    bad = make_chart(broken, 'region', 'revenue')
+    lost = make_chart(gone, 'region', 'revenue')
+
+    status, body = get_charts(client, [good.id, bad.id, lost.id])
+
+    assert status == 200
+    assert series_for(body, good)['labels'] == ['north', 'south', 'north', '0']
+    assert series_for(body, bad) is None
+    assert series_for(body, lost) is None
+
+
+def test_other_users_charts_are_excluded(client, sales, make_chart):
+    other = User(username='bob', email='bob@example.com')
+    other.set_password('password')
+    db.session.add(other)
+    db.session.commit()
+    mine = make_chart(sales, 'region', 'revenue')
+    theirs = make_chart(sales, 'region', 'revenue', owner=other)
+
+    _, body = get_charts(client, [mine.id, theirs.id, 9999])
+
+    assert list(body['charts']) == [str(mine.id)]
+
+
+def test_series_is_capped_and_flagged(client, app, sales, make_chart, monkeypatch):
+    monkeypatch.setitem(app.config, 'CHART_SERIES_MAX_POINTS', 2)
+    chart = make_chart(sales, 'region', 'revenue')
+
+    _, body = get_charts(client, [chart.id])
+
+    series = series_for(body, chart)
+    assert series['labels'] == ['north', 'south']
+    assert series['total'] == 4
+    assert series['truncated'] is True
+
+
+def test_series_is_cached_until_the_file_changes(client, app, sales, make_chart, read_spy):
+    chart = make_chart(sales, 'region', 'revenue')
+
+    get_charts(client, [chart.id])
+    get_charts(client, [chart.id])
+    assert len(read_spy) == 1
+
+    path = os.path.join(app.config['UPLOAD_FOLDER'], sales.filename)
+    pd.DataFrame({'region': ['east'], 'revenue': [1]}).to_csv(path, index=False)
+    os.utime(path, (0, os.path.getmtime(path) + 10))
+
+    _, body = get_charts(client, [chart.id])
+    assert len(read_spy) == 2
+    assert series_for(body, chart)['labels'] == ['east']
+
+
+def test_single_chart_view_uses_the_same_series(client, sales, make_chart):
+    chart = make_chart(sales, 'region', 'revenue')
+
+    _, batch = get_charts(client, [chart.id])
+    single = client.get(f'/get-chart/{chart.id}').get_json()
+
+    assert single['chart']['series'] == series_for(batch, chart)
+
+
+@pytest.mark.parametrize('body', [
+    {},
+    {'chart_ids': []},
+    {'chart_ids': 'x'},
+    {'chart_ids': ['a']},
+    {'chart_ids': [None]},
+    {'chart_ids': [1.7]},
+    {'chart_ids': [True]},
+    {'chart_ids': ['1.5']},
+    [1, 2],
+])
+def test_invalid_input_is_rejected(client, body):
+    response = client.post('/get-charts', json=body)
+
+    assert response.status_code == 400
+
+
+def test_too_many_chart_ids_are_rejected(client, app):
+    status, body = get_charts(client, list(range(1, app.config['CHART_BATCH_MAX'] + 2)))
+
+    assert status == 400
+    assert 'Too many charts' in body['error']
+
+
+def test_digit_string_ids_are_accepted(client, sales, make_chart):
+    chart = make_chart(sales, 'region', 'revenue')
+
+    status, body = get_charts(client, [str(chart.id)])
+
+    assert status == 200
+    assert list(body['charts']) == [str(chart.id)]